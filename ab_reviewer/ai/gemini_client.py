@@ -11,6 +11,7 @@ from contextlib import contextmanager
 from ..utils.exceptions import AIReviewError
 from ..utils.subprocess_utils import run_command, check_tool_available
 from ..utils.git import GitManager
+from ..utils.paths import resolve_cached
 
 
 class GeminiClient:
@@ -24,7 +25,7 @@ class GeminiClient:
             project_path: Path to the project
             dry_run: If True, skip actual Gemini CLI calls (for testing)
         """
-        self.project_path = Path(project_path).resolve()
+        self.project_path = resolve_cached(project_path)
         self.git_manager = GitManager(self.project_path)
         self.logger = logging.getLogger(__name__)
         self.dry_run = dry_run
@@ -1,9 +1,13 @@
 """Command-line interface for AB Code Reviewer."""
 
+import copy
+import functools
+import glob
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import click
 import yaml
@@ -25,8 +29,17 @@ from ab_reviewer.utils.exceptions import (
 )
 from ab_reviewer.utils.logger import setup_logger
 from ab_reviewer.utils.project_analyzer import ProjectAnalyzer
+from ab_reviewer.utils.jsonio import dumps, load_json, loads
 from ab_reviewer.utils.report_generator import ReportGenerator
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YAMLLoader
+
+# Suffix that marks the JSON copies of project configs this tool writes
+_JSON_CACHE_SUFFIX = ".abr-cache.json"
+
 
 # Simple validation functions for MVP
 def validate_python_version():
@@ -158,14 +171,18 @@ def main(
                 report_generator = ReportGenerator(project_dir)
 
                 # Generate and save reports
-                md_report = report_generator.save_markdown_report()
-                json_report = report_generator.save_json_report()
+                saved_reports = report_generator.save_reports(formats=("md", "json"))
 
-                click.echo(f"✅ Markdown report saved to: {md_report}")
-                click.echo(f"✅ JSON report saved to: {json_report}")
+                for fmt, label in (("md", "Markdown"), ("json", "JSON")):
+                    if fmt in report_generator.reused_formats:
+                        click.echo(
+                            f"✅ {label} report unchanged, reusing: {saved_reports[fmt]}"
+                        )
+                    else:
+                        click.echo(f"✅ {label} report saved to: {saved_reports[fmt]}")
 
-                # Show summary
-                report_data = report_generator.generate_comprehensive_report()
+                # Show summary from the report data that was just saved
+                report_data = report_generator.last_report or {}
                 summary = report_data.get("summary", {})
                 click.echo("\n📈 Summary:")
                 click.echo(f"  - Total Reviews: {summary.get('total_reviews', 0)}")
@@ -359,25 +376,109 @@ def main(
         sys.exit(1)
 
 
+def _json_cache_enabled(directory: str) -> bool:
+    """Whether parsed YAML may be cached as JSON in the given directory."""
+    return os.environ.get("AB_REVIEWER_CACHE") == "1" and os.access(directory, os.W_OK)
+
+
+def _json_cache_path(yaml_path: Path, mtime_ns: int) -> Path:
+    """Path of the JSON cache for a YAML file at a given modification time."""
+    return yaml_path.with_name(f"{yaml_path.name}.{mtime_ns}{_JSON_CACHE_SUFFIX}")
+
+
+def _write_json_cache(yaml_path: Path, mtime_ns: int, data: Any) -> None:
+    """
+    Write parsed YAML next to its source as ``<name>.<mtime_ns>.abr-cache.json``.
+
+    Nothing is written unless the data survives a JSON round trip unchanged
+    (dates or non-string keys would not). Caches this tool wrote for older
+    mtimes of the same file are removed; no other files are touched.
+    """
+    try:
+        payload = dumps(data)
+    except TypeError:
+        return  # Not JSON-serialisable
+    if loads(payload) != data:
+        return
+
+    cache_path = _json_cache_path(yaml_path, mtime_ns)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return
+
+    stale_name = re.compile(
+        rf"{re.escape(yaml_path.name)}\.\d+{re.escape(_JSON_CACHE_SUFFIX)}"
+    )
+    for stale in yaml_path.parent.glob(
+        f"{glob.escape(yaml_path.name)}.*{_JSON_CACHE_SUFFIX}"
+    ):
+        if stale_name.fullmatch(stale.name) and stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, json_cache: bool) -> Any:
+    """
+    Parse a YAML file; the mtime key invalidates stale entries.
+
+    With ``json_cache`` and AB_REVIEWER_CACHE=1 the parsed data is also
+    written next to the file as ``<name>.<mtime_ns>.abr-cache.json`` and
+    read from there on later runs.
+    """
+    yaml_path = Path(path)
+    use_cache = json_cache and _json_cache_enabled(str(yaml_path.parent))
+    if use_cache:
+        try:
+            return load_json(_json_cache_path(yaml_path, mtime_ns))
+        except (OSError, ValueError):
+            pass  # Missing or corrupt cache; fall back to the YAML source
+
+    with open(path, "r", encoding="utf-8") as f:
+        # _YAMLLoader is always CSafeLoader or SafeLoader; bandit cannot tell
+        data = yaml.load(f, Loader=_YAMLLoader)  # nosec B506
+
+    if use_cache:
+        _write_json_cache(yaml_path, mtime_ns, data)
+    return data
+
+
+def _load_yaml(path: Path, json_cache: bool = False) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while it is unchanged.
+
+    Args:
+        path: YAML file to load
+        json_cache: Allow an on-disk JSON cache next to the file (project
+            configs only; the packaged default is covered by the
+            in-process cache)
+
+    Returns:
+        A private copy of the parsed data
+    """
+    data = _parse_yaml_cached(str(path), os.stat(path).st_mtime_ns, json_cache)
+    return copy.deepcopy(data)
+
+
 def load_configuration(config_path: Optional[Path], project_path: Path) -> dict:
     """Load configuration from file or use defaults."""
     # Load default configuration
     default_config_path = Path(__file__).parent / "config" / "default_config.yaml"
-    with open(default_config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = _load_yaml(default_config_path)
 
     # Override with project-specific config if provided
     if config_path:
-        with open(config_path, "r", encoding="utf-8") as f:
-            project_config = yaml.safe_load(f)
-            config = merge_configs(config, project_config)
+        project_config = _load_yaml(config_path, json_cache=True)
+        config = merge_configs(config, project_config)
     else:
         # Look for .ab-reviewer.yaml in project root
         project_config_path = project_path / ".ab-reviewer.yaml"
         if project_config_path.exists():
-            with open(project_config_path, "r", encoding="utf-8") as f:
-                project_config = yaml.safe_load(f)
-                config = merge_configs(config, project_config)
+            project_config = _load_yaml(project_config_path, json_cache=True)
+            config = merge_configs(config, project_config)
 
     return config
 
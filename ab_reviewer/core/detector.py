@@ -1,9 +1,10 @@
 """Project type detection for AB Code Reviewer."""
 
-from pathlib import Path
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Optional, Set
 
 from ..utils.exceptions import ProjectDetectionError
+from ..utils.paths import resolve_cached
 
 
 class ProjectDetector:
@@ -19,7 +20,7 @@ class ProjectDetector:
         Raises:
             ProjectDetectionError: If project path is invalid
         """
-        self.project_path = Path(project_path).resolve()
+        self.project_path = resolve_cached(project_path)
 
         # Validate project path
         if not self.project_path.exists():
@@ -42,11 +43,12 @@ class ProjectDetector:
             ProjectDetectionError: If detection fails
         """
         try:
-            if self._is_python_project():
+            names = self._root_names()
+            if self._is_python_project(names):
                 return "python"
-            elif self._is_java_project():
+            elif self._is_java_project(names):
                 return "java"
-            elif self._is_go_project():
+            elif self._is_go_project(names):
                 return "go"
             else:
                 return "unknown"
@@ -54,8 +56,15 @@ class ProjectDetector:
         except Exception as e:
             raise ProjectDetectionError(f"Failed to detect project type: {str(e)}")
 
-    def _is_python_project(self) -> bool:
+    def _root_names(self) -> Set[str]:
+        """Names of the entries in the project root, read in one pass."""
+        with os.scandir(self.project_path) as entries:
+            return {entry.name for entry in entries}
+
+    def _is_python_project(self, names: Optional[Set[str]] = None) -> bool:
         """Check if this is a Python project."""
+        if names is None:
+            names = self._root_names()
         python_indicators = [
             "pyproject.toml",
             "setup.py",
@@ -64,10 +73,11 @@ class ProjectDetector:
             "poetry.lock",
         ]
 
-        # Check for indicators in root directory
-        for indicator in python_indicators:
-            if (self.project_path / indicator).exists():
-                return True
+        # Check for indicators and Python files in root directory
+        if not names.isdisjoint(python_indicators):
+            return True
+        if any(name.endswith(".py") for name in names):
+            return True
 
         # Check for indicators in subdirectories (up to 2 levels deep)
         for indicator in python_indicators:
@@ -76,11 +86,6 @@ class ProjectDetector:
             ):
                 return True
 
-        # Check for Python files in root
-        python_files = list(self.project_path.glob("*.py"))
-        if python_files:
-            return True
-
         # Check for Python files in subdirectories (up to 2 levels deep)
         python_files = list(self.project_path.glob("**/*.py"))
         if python_files:
@@ -88,17 +93,18 @@ class ProjectDetector:
 
         return False
 
-    def _is_java_project(self) -> bool:
+    def _is_java_project(self, names: Optional[Set[str]] = None) -> bool:
         """Check if this is a Java project."""
+        if names is None:
+            names = self._root_names()
         java_indicators = [
             "pom.xml",
             "build.gradle",
             "build.gradle.kts",
         ]
 
-        for indicator in java_indicators:
-            if (self.project_path / indicator).exists():
-                return True
+        if not names.isdisjoint(java_indicators):
+            return True
 
         # Check for Java files
         java_files = list(self.project_path.glob("**/*.java"))
@@ -107,16 +113,17 @@ class ProjectDetector:
 
         return False
 
-    def _is_go_project(self) -> bool:
+    def _is_go_project(self, names: Optional[Set[str]] = None) -> bool:
         """Check if this is a Go project."""
+        if names is None:
+            names = self._root_names()
         go_indicators = [
             "go.mod",
             "Gopkg.toml",
         ]
 
-        for indicator in go_indicators:
-            if (self.project_path / indicator).exists():
-                return True
+        if not names.isdisjoint(go_indicators):
+            return True
 
         # Check for Go files
         go_files = list(self.project_path.glob("**/*.go"))
@@ -1,10 +1,10 @@
 """Enhanced Tool execution orchestration for AB Code Reviewer."""
 
 import logging
-from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
 from ..utils.subprocess_utils import run_command
+from ..utils.paths import resolve_cached
 from .quality_gate import QualityGateManager, GateStatus
 
 
@@ -12,7 +12,10 @@ class EnhancedToolRunner:
     """Enhanced orchestrator for quality gate tools with progressive enhancement."""
 
     def __init__(
-        self, project_path: str = ".", config: Optional[Dict[str, Any]] = None
+        self,
+        project_path: str = ".",
+        config: Optional[Dict[str, Any]] = None,
+        legacy_mode: bool = False,
     ):
         """
         Initialize enhanced runner with project path and configuration.
@@ -20,12 +23,16 @@ class EnhancedToolRunner:
         Args:
             project_path: Path to the project
             config: Configuration dictionary
+            legacy_mode: If True, skip the quality gate manager and require
+                every tool to pass before AI review
         """
-        self.project_path = Path(project_path).resolve()
+        self.project_path = resolve_cached(project_path)
         self.config = config or {}
         self.results = {}
         self.logger = logging.getLogger(__name__)
-        self.quality_gate_manager = QualityGateManager(self.project_path, config)
+        self.quality_gate_manager: Optional[QualityGateManager] = (
+            None if legacy_mode else QualityGateManager(self.project_path, config)
+        )
 
     def run_quality_gates(
         self, gate_names: Optional[List[str]] = None, progressive: bool = True
@@ -42,9 +49,10 @@ class EnhancedToolRunner:
         """
         print("🔍 Running quality gates...")
 
-        if progressive:
+        manager = self.quality_gate_manager
+        if progressive and manager is not None:
             # Use enhanced quality gate manager for progressive execution
-            gate_results = self.quality_gate_manager.run_all_gates(gate_names)
+            gate_results = manager.run_all_gates(gate_names)
 
             # Convert to legacy format for compatibility
             self.results = {}
@@ -59,7 +67,7 @@ class EnhancedToolRunner:
                 }
 
             # Print summary
-            summary = self.quality_gate_manager.get_summary()
+            summary = manager.get_summary()
             print("\n📊 Quality Gates Summary:")
             print(f"  ✅ Successful: {summary['successful']}/{summary['total_gates']}")
             print(f"  ❌ Failed: {summary['failed']}")
@@ -121,7 +129,7 @@ class EnhancedToolRunner:
 
     def can_proceed_to_ai_review(self) -> bool:
         """Check if we can proceed to AI review based on quality gate results."""
-        if hasattr(self, "quality_gate_manager"):
+        if self.quality_gate_manager is not None:
             summary = self.quality_gate_manager.get_summary()
             return summary["can_proceed_to_ai"]
         else:
@@ -130,7 +138,7 @@ class EnhancedToolRunner:
 
     def get_ai_context(self) -> Dict[str, Any]:
         """Get context for AI review from quality gate results."""
-        if hasattr(self, "quality_gate_manager"):
+        if self.quality_gate_manager is not None:
             return self.quality_gate_manager.get_ai_context()
         else:
             # Legacy mode: return all results
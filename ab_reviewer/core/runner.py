@@ -1,10 +1,10 @@
 """Tool execution orchestrator for AB Code Reviewer."""
 
 import logging
-from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
 from ..utils.subprocess_utils import run_command
+from ..utils.paths import resolve_cached
 
 
 class ToolRunner:
@@ -20,7 +20,7 @@ class ToolRunner:
             project_path: Path to the project
             config: Configuration dictionary
         """
-        self.project_path = Path(project_path).resolve()
+        self.project_path = resolve_cached(project_path)
         self.config = config or {}
         self.results = {}
         self.logger = logging.getLogger(__name__)
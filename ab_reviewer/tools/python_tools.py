@@ -1,13 +1,16 @@
 """Python-specific tool integrations for AB Code Reviewer."""
 
 import os
-import subprocess
 import sys
 from pathlib import Path
 from typing import List, Dict, Tuple
 
 from ..utils.exceptions import ToolExecutionError, ValidationError
-from ..utils.subprocess_utils import run_command, check_tool_available
+from ..utils.subprocess_utils import (
+    run_command,
+    check_tools_available,
+    get_tool_version,
+)
 
 
 class PythonTools:
@@ -44,11 +47,8 @@ class PythonTools:
             ToolExecutionError: If installation fails
         """
         tools = ["black", "pylint", "bandit", "pytest", "pytest-cov"]
-        missing_tools = []
-
-        for tool in tools:
-            if not check_tool_available(tool):
-                missing_tools.append(tool)
+        availability = check_tools_available(tools)
+        missing_tools = [tool for tool in tools if not availability[tool]]
 
         if not missing_tools:
             return True
@@ -60,6 +60,7 @@ class PythonTools:
         success, output = run_command(cmd, timeout=120)
 
         if success:
+            get_tool_version.cache_clear()
             print("✅ Tools installed successfully")
             return True
         else:
@@ -72,16 +73,7 @@ class PythonTools:
         versions = {}
 
         for tool in tools:
-            try:
-                result = subprocess.run(
-                    [tool, "--version"], capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
-                    versions[tool] = result.stdout.strip()
-                else:
-                    versions[tool] = "Not installed"
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                versions[tool] = "Not installed"
+            versions[tool] = get_tool_version(tool, timeout=10) or "Not installed"
 
         return versions
 
@@ -103,11 +95,9 @@ class PythonTools:
             issues.append("Not in a virtual environment (recommended)")
 
         # Check for required tools
-        missing_tools = []
         tools = ["black", "pylint", "bandit", "pytest"]
-        for tool in tools:
-            if not check_tool_available(tool):
-                missing_tools.append(tool)
+        availability = check_tools_available(tools)
+        missing_tools = [tool for tool in tools if not availability[tool]]
 
         if missing_tools:
             issues.append(f"Missing tools: {', '.join(missing_tools)}")
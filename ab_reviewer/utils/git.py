@@ -1,11 +1,14 @@
 """Git utilities for AB Code Reviewer."""
 
 import subprocess
+from collections import namedtuple
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict
 
 from .exceptions import ToolExecutionError
 
+Commit = namedtuple("Commit", "hash message author date")
+
 
 class GitManager:
     """Manages git operations for code review context."""
@@ -79,7 +82,7 @@ class GitManager:
 
         return None
 
-    def get_recent_commits(self, count: int = 5) -> List[Dict[str, Any]]:
+    def get_recent_commits(self, count: int = 5) -> List[Commit]:
         """
         Get recent commit information.
 
@@ -87,18 +90,21 @@ class GitManager:
             count: Number of recent commits to retrieve
 
         Returns:
-            List of commit information dictionaries
+            List of Commit tuples (hash, message, author, date)
         """
         if not self.is_git_repository():
             return []
 
         try:
+            # Fields are separated by US (0x1f) and records by NUL (-z), so
+            # commit subjects may safely contain "|" or any printable text.
             result = subprocess.run(
                 [
                     "git",
                     "log",
                     f"-{count}",
-                    "--pretty=format:%H|%s|%an|%ad",
+                    "-z",
+                    "--pretty=format:%H%x1f%s%x1f%an%x1f%ad",
                     "--date=short",
                 ],
                 cwd=self.project_path,
@@ -110,21 +116,11 @@ class GitManager:
             if result.returncode != 0:
                 return []
 
-            commits = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    parts = line.split("|", 3)
-                    if len(parts) >= 4:
-                        commits.append(
-                            {
-                                "hash": parts[0],
-                                "message": parts[1],
-                                "author": parts[2],
-                                "date": parts[3],
-                            }
-                        )
-
-            return commits
+            return [
+                Commit(*fields)
+                for fields in (rec.split("\x1f") for rec in result.stdout.split("\x00"))
+                if len(fields) == 4
+            ]
 
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return []
@@ -0,0 +1,55 @@
+"""JSON helpers for AB Code Reviewer, using orjson when it is installed."""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialise an object to JSON bytes.
+
+    Args:
+        obj: Object to serialise
+        indent: Indent nested structures by two spaces
+        sort_keys: Sort dictionary keys
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If the object is not JSON-serialisable
+    """
+    if HAS_ORJSON:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    text = json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+    return text.encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or text."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Any) -> Any:
+    """Parse a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def dump_json(obj: Any, path: Any) -> None:
+    """Write an object to a file as indented JSON."""
+    Path(path).write_bytes(dumps(obj, indent=True))
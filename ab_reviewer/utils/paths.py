@@ -0,0 +1,31 @@
+"""Path helpers for AB Code Reviewer."""
+
+import functools
+import os
+from pathlib import Path
+from typing import Union
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve(path: str, cwd: str) -> Path:
+    """Resolve a path relative to a given working directory."""
+    return (Path(cwd) / path).resolve()
+
+
+def resolve_cached(path: Union[str, "os.PathLike[str]"]) -> Path:
+    """
+    Resolve a path, memoising the result.
+
+    For relative paths the current working directory is part of the cache
+    key, so they stay correct if the process changes directory. Absolute
+    paths skip the ``getcwd()`` call, so they still resolve if the working
+    directory has been removed.
+
+    Args:
+        path: Path to resolve
+
+    Returns:
+        Absolute, symlink-free path
+    """
+    path = os.fspath(path)
+    return _resolve(path, "" if os.path.isabs(path) else os.getcwd())
@@ -1,9 +1,96 @@
 """Report generation utilities for AB Code Reviewer."""
 
-import json
+import copy
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Set, TextIO, Tuple, TypedDict
+
+from .exceptions import ValidationError
+from .jsonio import dump_json, dumps, load_json
+
+
+def _read_json(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file; ``mtime_ns`` only serves as part of the cache key."""
+    return load_json(path)
+
+
+# The project analysis gets its own small cache so a long review history
+# cannot evict it. The review cache is sized well above any realistic
+# history but stays bounded, since every file version is a new key.
+_load_analysis_cached = lru_cache(maxsize=4)(_read_json)
+_load_review_json_cached = lru_cache(maxsize=1024)(_read_json)
+
+
+def _load_json_file(
+    path: Any, cache: Callable[[str, int], Any] = _load_review_json_cached
+) -> Any:
+    """
+    Load a JSON file through a process-wide cache keyed by modification time.
+
+    Returns:
+        A private copy of the parsed data
+    """
+    return copy.deepcopy(cache(str(path), os.stat(path).st_mtime_ns))
+
+
+def _report_digest(report_data: Dict[str, Any]) -> str:
+    """Hash report content, ignoring when the report was generated."""
+    content = {k: v for k, v in report_data.items() if k != "generated_at"}
+    payload = dumps(content, sort_keys=True)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+_LAST_REPORT_HASH_FILE = ".last_hash"
+
+_MARKDOWN_HEADER_TEMPLATE = """\
+# AB Code Reviewer Report: {project_name}
+**Generated:** {generated_at}
+
+## 📊 Summary
+- **Total Reviews:** {total_reviews}
+- **Project Complexity:** {project_complexity}
+- **Overall Health:** {overall_health}
+"""
+
+_MARKDOWN_ANALYSIS_TEMPLATE = """\
+## 🔍 Project Analysis
+- **Total Files:** {total_files}
+- **Python Files:** {python_files}
+- **Directories:** {total_directories}
+"""
+
+_PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
+class ReviewRecord(TypedDict):
+    """Data loaded from a single review run directory."""
+
+    timestamp: str
+    log_file: Optional[str]
+    quality_gates: Optional[Dict[str, Any]]
+    ai_review: Optional[str]
+    summary: Optional[Dict[str, Any]]
+
+
+class QualityTrend(TypedDict):
+    """Pass/fail counts for one quality gate across reviews."""
+
+    passed: int
+    failed: int
+
+
+class Recommendation(TypedDict):
+    """An actionable recommendation included in the report."""
+
+    category: str
+    priority: str
+    title: str
+    description: str
 
 
 class ReportGenerator:
@@ -18,6 +105,10 @@ class ReportGenerator:
         """
         self.project_dir = project_dir.resolve()
         self.project_name = self.project_dir.name
+        # Report data built by the most recent save_reports() call, and the
+        # formats it reused from an earlier, unchanged report
+        self.last_report: Optional[Dict[str, Any]] = None
+        self.reused_formats: Set[str] = set()
 
     def generate_comprehensive_report(self) -> Dict[str, Any]:
         """
@@ -29,43 +120,60 @@ class ReportGenerator:
         report = {
             "project_name": self.project_name,
             "generated_at": datetime.now().isoformat(),
-            "project_analysis": self._load_project_analysis(),
-            "review_history": self._load_review_history(),
+            "project_analysis": self.project_analysis,
+            "review_history": self.review_history,
             "summary": self._generate_summary(),
             "recommendations": self._generate_recommendations(),
         }
 
         return report
 
+    @cached_property
+    def project_analysis(self) -> Optional[Dict[str, Any]]:
+        """Project analysis data, loaded from disk once per instance."""
+        return self._load_project_analysis()
+
+    @cached_property
+    def review_history(self) -> List[ReviewRecord]:
+        """Review history, loaded from disk once per instance."""
+        return self._load_review_history()
+
     def _load_project_analysis(self) -> Optional[Dict[str, Any]]:
         """Load project analysis data."""
         analysis_file = self.project_dir / "structure" / "project_analysis.json"
-        if analysis_file.exists():
-            with open(analysis_file, "r") as f:
-                return json.load(f)
-        return None
+        try:
+            analysis: Dict[str, Any] = _load_json_file(
+                analysis_file, _load_analysis_cached
+            )
+            return analysis
+        except FileNotFoundError:
+            return None
 
-    def _load_review_history(self) -> List[Dict[str, Any]]:
+    def _load_review_history(self) -> List[ReviewRecord]:
         """Load review history from all review runs."""
         reviews_dir = self.project_dir / "reviews"
         if not reviews_dir.exists():
             return []
 
-        review_history = []
-
-        # Get all review directories, sorted by timestamp
-        review_dirs = sorted([d for d in reviews_dir.iterdir() if d.is_dir()])
+        # Get all review directories, sorted by timestamp (DirEntry.is_dir
+        # reuses the type returned by the directory listing, avoiding a stat)
+        with os.scandir(reviews_dir) as it:
+            review_dirs = sorted(
+                (Path(entry.path) for entry in it if entry.is_dir()),
+                key=lambda path: path.name,
+            )
+        if not review_dirs:
+            return []
 
-        for review_dir in review_dirs:
-            review_data = self._load_single_review(review_dir)
-            if review_data:
-                review_history.append(review_data)
+        # Loading is I/O-bound, so overlap the file reads; map() keeps order
+        with ThreadPoolExecutor(max_workers=min(32, len(review_dirs))) as executor:
+            results = list(executor.map(self._load_single_review, review_dirs))
 
-        return review_history
+        return [review_data for review_data in results if review_data]
 
-    def _load_single_review(self, review_dir: Path) -> Optional[Dict[str, Any]]:
+    def _load_single_review(self, review_dir: Path) -> Optional[ReviewRecord]:
         """Load data from a single review run."""
-        review_data = {
+        review_data: ReviewRecord = {
             "timestamp": review_dir.name,
             "log_file": None,
             "quality_gates": None,
@@ -73,35 +181,38 @@ class ReportGenerator:
             "summary": None,
         }
 
+        # Classify the directory contents in a single scan
+        with os.scandir(review_dir) as it:
+            entries = {entry.name: entry.path for entry in it if entry.is_file()}
+
         # Look for log file
-        log_files = list(review_dir.glob("*.log"))
-        if log_files:
-            review_data["log_file"] = str(log_files[0])
+        log_file = next(
+            (path for name, path in entries.items() if name.endswith(".log")), None
+        )
+        if log_file is not None:
+            review_data["log_file"] = log_file
 
         # Look for quality gates results
-        quality_file = review_dir / "quality_gates.json"
-        if quality_file.exists():
-            with open(quality_file, "r") as f:
-                review_data["quality_gates"] = json.load(f)
+        quality_file = entries.get("quality_gates.json")
+        if quality_file:
+            review_data["quality_gates"] = _load_json_file(quality_file)
 
         # Look for AI review
-        ai_review_file = review_dir / "ai_review.md"
-        if ai_review_file.exists():
-            with open(ai_review_file, "r") as f:
-                review_data["ai_review"] = f.read()
+        ai_review_file = entries.get("ai_review.md")
+        if ai_review_file:
+            review_data["ai_review"] = Path(ai_review_file).read_text(encoding="utf-8")
 
         # Look for summary
-        summary_file = review_dir / "summary.json"
-        if summary_file.exists():
-            with open(summary_file, "r") as f:
-                review_data["summary"] = json.load(f)
+        summary_file = entries.get("summary.json")
+        if summary_file:
+            review_data["summary"] = _load_json_file(summary_file)
 
         return review_data
 
     def _generate_summary(self) -> Dict[str, Any]:
         """Generate summary statistics."""
-        analysis = self._load_project_analysis()
-        reviews = self._load_review_history()
+        analysis = self.project_analysis
+        reviews = self.review_history
 
         summary = {
             "total_reviews": len(reviews),
@@ -112,40 +223,44 @@ class ReportGenerator:
         }
 
         if analysis:
-            summary["project_complexity"] = analysis.get(
-                "estimated_complexity", {}
-            ).get("complexity_level", "unknown")
-            summary["total_files"] = analysis.get("file_structure", {}).get(
-                "total_files", 0
-            )
-            summary["python_files"] = analysis.get("python_files", {}).get(
-                "total_python_files", 0
+            complexity = analysis.get("estimated_complexity") or {}
+            file_structure = analysis.get("file_structure") or {}
+            python_files = analysis.get("python_files") or {}
+            summary["project_complexity"] = complexity.get(
+                "complexity_level", "unknown"
             )
+            summary["total_files"] = file_structure.get("total_files", 0)
+            summary["python_files"] = python_files.get("total_python_files", 0)
 
         # Analyze quality trends
         if reviews:
-            quality_trends = {
+            quality_trends: Dict[str, QualityTrend] = {
                 "formatter": {"passed": 0, "failed": 0},
                 "linter": {"passed": 0, "failed": 0},
                 "security": {"passed": 0, "failed": 0},
                 "tests": {"passed": 0, "failed": 0},
             }
 
+            # Tally trends and overall totals in a single pass
+            total_checks = total_passed = 0
             for review in reviews:
-                if review.get("quality_gates"):
-                    gates = review["quality_gates"]
-                    for tool, result in gates.items():
-                        if tool in quality_trends:
-                            if result.get("success", False):
-                                quality_trends[tool]["passed"] += 1
-                            else:
-                                quality_trends[tool]["failed"] += 1
+                gates = review.get("quality_gates")
+                if not gates:
+                    continue
+                for tool, result in gates.items():
+                    trend = quality_trends.get(tool)
+                    if trend is None:
+                        continue
+                    total_checks += 1
+                    if result.get("success", False):
+                        trend["passed"] += 1
+                        total_passed += 1
+                    else:
+                        trend["failed"] += 1
 
             summary["quality_trends"] = quality_trends
 
             # Determine overall health
-            total_checks = sum(sum(trend.values()) for trend in quality_trends.values())
-            total_passed = sum(trend["passed"] for trend in quality_trends.values())
 
             if total_checks > 0:
                 pass_rate = total_passed / total_checks
@@ -158,15 +273,15 @@ class ReportGenerator:
 
         return summary
 
-    def _generate_recommendations(self) -> List[Dict[str, str]]:
+    def _generate_recommendations(self) -> List[Recommendation]:
         """Generate actionable recommendations."""
-        recommendations = []
-        analysis = self._load_project_analysis()
-        reviews = self._load_review_history()
+        recommendations: List[Recommendation] = []
+        analysis = self.project_analysis
+        reviews = self.review_history
 
         # Project structure recommendations
         if analysis:
-            file_structure = analysis.get("file_structure", {})
+            file_structure = analysis.get("file_structure") or {}
             if file_structure.get("total_files", 0) > 100:
                 recommendations.append(
                     {
@@ -177,7 +292,7 @@ class ReportGenerator:
                     }
                 )
 
-            python_files = analysis.get("python_files", {})
+            python_files = analysis.get("python_files") or {}
             if python_files.get("total_python_files", 0) > 50:
                 recommendations.append(
                     {
@@ -190,10 +305,8 @@ class ReportGenerator:
 
         # Quality gate recommendations
         if reviews:
-            latest_review = reviews[-1] if reviews else None
-            if latest_review and latest_review.get("quality_gates"):
-                gates = latest_review["quality_gates"]
-
+            gates = reviews[-1]["quality_gates"]
+            if gates:
                 if not gates.get("formatter", {}).get("success", True):
                     recommendations.append(
                         {
@@ -235,7 +348,8 @@ class ReportGenerator:
                     )
 
         # General recommendations
-        if not analysis or not analysis.get("git_info", {}).get("is_git_repo", False):
+        git_info = (analysis.get("git_info") if analysis else None) or {}
+        if not git_info.get("is_git_repo", False):
             recommendations.append(
                 {
                     "category": "version_control",
@@ -247,6 +361,78 @@ class ReportGenerator:
 
         return recommendations
 
+    def save_reports(
+        self,
+        formats: Tuple[str, ...] = ("md", "json"),
+        output_dir: Optional[Path] = None,
+        skip_unchanged: bool = True,
+    ) -> Dict[str, Path]:
+        """
+        Save comprehensive report in several formats at once.
+
+        The report is generated once and all files share one timestamp; the
+        report data is kept in ``last_report``. When the report content
+        (ignoring its generation time) matches the last saved report, the
+        existing files are returned instead of new ones and their formats
+        are listed in ``reused_formats``.
+
+        Args:
+            formats: Report formats to save ("md" and/or "json")
+            output_dir: Directory to save reports (defaults to project_dir/reports/)
+            skip_unchanged: Reuse previous report files if content is unchanged
+
+        Returns:
+            Dictionary mapping each format to its saved report file
+
+        Raises:
+            ValidationError: If an unsupported format is requested
+        """
+        writers = {"md": self._write_md, "json": self._write_json}
+        unsupported = [fmt for fmt in formats if fmt not in writers]
+        if unsupported:
+            raise ValidationError(
+                f"Unsupported report format(s): {', '.join(unsupported)}"
+            )
+
+        reports_dir = output_dir or self.project_dir / "reports"
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        # Use timestamped filename format
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+        report_data = self.generate_comprehensive_report()
+        self.last_report = report_data
+        digest = _report_digest(report_data)
+
+        hash_file = reports_dir / _LAST_REPORT_HASH_FILE
+        try:
+            loaded = load_json(hash_file)
+        except (OSError, ValueError):
+            loaded = None
+        # Merge into the existing entries so formats not saved now are kept
+        previous: Dict[str, Any] = loaded if isinstance(loaded, dict) else {}
+
+        saved = {}
+        self.reused_formats = set()
+        for fmt in formats:
+            last = previous.get(fmt) or {}
+            if (
+                skip_unchanged
+                and last.get("hash") == digest
+                and Path(last.get("path", "")).is_file()
+            ):
+                saved[fmt] = Path(last["path"])
+                self.reused_formats.add(fmt)
+                continue
+
+            output_path = reports_dir / f"report_{timestamp}.{fmt}"
+            writers[fmt](report_data, output_path)
+            saved[fmt] = output_path
+            previous[fmt] = {"hash": digest, "path": str(output_path)}
+
+        dump_json(previous, hash_file)
+
+        return saved
+
     def save_markdown_report(self, output_path: Optional[Path] = None) -> Path:
         """
         Save comprehensive report as Markdown.
@@ -258,94 +444,118 @@ class ReportGenerator:
             Path to saved report file
         """
         if output_path is None:
-            reports_dir = self.project_dir / "reports"
-            reports_dir.mkdir(exist_ok=True)
-            # Use timestamped filename format
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            output_path = reports_dir / f"report_{timestamp}.md"
+            return self.save_reports(formats=("md",))["md"]
 
-        report_data = self.generate_comprehensive_report()
+        self._write_md(self.generate_comprehensive_report(), output_path)
+        return output_path
 
+    def _write_md(self, report_data: Dict[str, Any], output_path: Path) -> None:
+        """Write report data to a Markdown file."""
         with open(output_path, "w") as f:
-            f.write(self._format_markdown_report(report_data))
-
-        return output_path
+            self._write_markdown_report(report_data, f)
 
     def _format_markdown_report(self, report_data: Dict[str, Any]) -> str:
-        """Format report data as Markdown."""
-        md = []
+        """
+        Format report data as Markdown.
+
+        Args:
+            report_data: Report data from generate_comprehensive_report()
+
+        Returns:
+            Markdown string
+        """
+        buffer = io.StringIO()
+        self._write_markdown_report(report_data, buffer)
+        return buffer.getvalue()
+
+    def _write_markdown_report(self, report_data: Dict[str, Any], out: TextIO) -> None:
+        """
+        Write report data as Markdown to a text stream.
+
+        Args:
+            report_data: Report data from generate_comprehensive_report()
+            out: Stream to write the report to
+        """
 
-        # Header
-        md.append(f"# AB Code Reviewer Report: {report_data['project_name']}")
-        md.append(f"**Generated:** {report_data['generated_at']}")
-        md.append("")
+        def write_section(text: str) -> None:
+            """Write a section, separated from the previous one by a blank line."""
+            out.write("\n")
+            out.write(text)
 
-        # Summary
+        # Header and Summary
         summary = report_data.get("summary", {})
-        md.append("## 📊 Summary")
-        md.append(f"- **Total Reviews:** {summary.get('total_reviews', 0)}")
-        md.append(
-            f"- **Project Complexity:** {summary.get('project_complexity', 'unknown').title()}"
-        )
-        md.append(
-            f"- **Overall Health:** {summary.get('overall_health', 'unknown').title()}"
+        out.write(
+            _MARKDOWN_HEADER_TEMPLATE.format_map(
+                {
+                    "project_name": report_data["project_name"],
+                    "generated_at": report_data["generated_at"],
+                    "total_reviews": summary.get("total_reviews", 0),
+                    "project_complexity": summary.get(
+                        "project_complexity", "unknown"
+                    ).title(),
+                    "overall_health": summary.get("overall_health", "unknown").title(),
+                }
+            )
         )
-        md.append("")
 
         # Project Analysis
         analysis = report_data.get("project_analysis")
         if analysis:
-            md.append("## 🔍 Project Analysis")
-            file_structure = analysis.get("file_structure", {})
-            md.append(f"- **Total Files:** {file_structure.get('total_files', 0)}")
-            md.append(
-                f"- **Python Files:** {analysis.get('python_files', {}).get('total_python_files', 0)}"
-            )
-            md.append(
-                f"- **Directories:** {file_structure.get('total_directories', 0)}"
+            file_structure = analysis.get("file_structure") or {}
+            python_files = analysis.get("python_files") or {}
+            write_section(
+                _MARKDOWN_ANALYSIS_TEMPLATE.format_map(
+                    {
+                        "total_files": file_structure.get("total_files", 0),
+                        "python_files": python_files.get("total_python_files", 0),
+                        "total_directories": file_structure.get("total_directories", 0),
+                    }
+                )
             )
-            md.append("")
 
         # Quality Trends
         quality_trends = summary.get("quality_trends", {})
         if quality_trends:
-            md.append("## 🔧 Quality Trends")
+            lines = ["## 🔧 Quality Trends"]
             for tool, trend in quality_trends.items():
                 total = trend["passed"] + trend["failed"]
                 if total > 0:
                     pass_rate = (trend["passed"] / total) * 100
-                    md.append(
+                    lines.append(
                         f"- **{tool.title()}:** {trend['passed']}/{total} ({pass_rate:.1f}% pass rate)"
                     )
-            md.append("")
+            lines.append("")
+            write_section("\n".join(lines))
 
         # Recommendations
         recommendations = report_data.get("recommendations", [])
         if recommendations:
-            md.append("## 💡 Recommendations")
+            lines = ["## 💡 Recommendations"]
             for rec in recommendations:
-                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(
-                    rec["priority"], "⚪"
+                priority_emoji = _PRIORITY_EMOJI.get(rec["priority"], "⚪")
+                lines.extend(
+                    [
+                        f"### {priority_emoji} {rec['title']}",
+                        f"**Category:** {rec['category']}",
+                        f"**Description:** {rec['description']}",
+                        "",
+                    ]
                 )
-                md.append(f"### {priority_emoji} {rec['title']}")
-                md.append(f"**Category:** {rec['category']}")
-                md.append(f"**Description:** {rec['description']}")
-                md.append("")
+            write_section("\n".join(lines))
 
         # Review History
         reviews = report_data.get("review_history", [])
         if reviews:
-            md.append("## 📈 Review History")
+            lines = ["## 📈 Review History"]
             for review in reviews[-5:]:  # Show last 5 reviews
-                md.append(f"### {review['timestamp']}")
+                lines.append(f"### {review['timestamp']}")
                 if review.get("quality_gates"):
                     gates = review["quality_gates"]
                     for tool, result in gates.items():
                         status = "✅" if result.get("success", False) else "❌"
-                        md.append(f"- **{tool.title()}:** {status}")
-                md.append("")
-
-        return "\n".join(md)
+                        lines.append(f"- **{tool.title()}:** {status}")
+                lines.append("")
+            write_section("\n".join(lines))
 
     def save_json_report(self, output_path: Optional[Path] = None) -> Path:
         """
@@ -358,15 +568,11 @@ class ReportGenerator:
             Path to saved report file
         """
         if output_path is None:
-            reports_dir = self.project_dir / "reports"
-            reports_dir.mkdir(exist_ok=True)
-            # Use timestamped filename format
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            output_path = reports_dir / f"report_{timestamp}.json"
-
-        report_data = self.generate_comprehensive_report()
-
-        with open(output_path, "w") as f:
-            json.dump(report_data, f, indent=2)
+            return self.save_reports(formats=("json",))["json"]
 
+        self._write_json(self.generate_comprehensive_report(), output_path)
         return output_path
+
+    def _write_json(self, report_data: Dict[str, Any], output_path: Path) -> None:
+        """Write report data to a JSON file."""
+        dump_json(report_data, output_path)
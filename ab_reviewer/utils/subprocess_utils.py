@@ -1,9 +1,10 @@
 """Subprocess utilities for AB Code Reviewer."""
 
+import functools
 import subprocess
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import shutil
 
 from .exceptions import ToolExecutionError, ToolNotFoundError
@@ -32,7 +33,8 @@ def run_command(
         raise ToolNotFoundError(f"Tool not found: {cmd[0]}")
 
     try:
-        logger.debug("Running command: %s (cwd=%s)", " ".join(cmd), cwd)
+        # Pass cmd itself so nothing is formatted unless DEBUG is enabled
+        logger.debug("Running command: %s (cwd=%s)", cmd, cwd)
         result = subprocess.run(
             cmd,
             cwd=str(cwd) if cwd else None,
@@ -67,16 +69,42 @@ def run_command(
         raise ToolExecutionError(msg) from e
 
 
-def check_tool_available(tool_name: str, timeout: int = 5) -> bool:
+def check_tool_available(tool_name: str) -> bool:
     """
-    Check tool availability using shutil.which and a lightweight '--version' call.
+    Check tool availability using shutil.which (no subprocess is spawned).
     """
-    if shutil.which(tool_name) is None:
-        return False
+    return shutil.which(tool_name) is not None
+
+
+def check_tools_available(tool_names: List[str]) -> Dict[str, bool]:
+    """
+    Check availability of several tools.
+
+    Returns:
+        Dictionary mapping each tool name to its availability
+    """
+    return {name: check_tool_available(name) for name in tool_names}
+
+
+@functools.lru_cache(maxsize=None)
+def get_tool_version(tool_name: str, timeout: int = 5) -> Optional[str]:
+    """
+    Get a tool's version string via a lightweight '--version' call.
+
+    Results are cached for the lifetime of the process; call
+    ``get_tool_version.cache_clear()`` after installing tools.
+
+    Returns:
+        Version output, or None if the tool is missing or the call fails
+    """
+    if not check_tool_available(tool_name):
+        return None
     try:
         result = subprocess.run(
             [tool_name, "--version"], capture_output=True, timeout=timeout, text=True
         )
-        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
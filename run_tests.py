@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test runner for AB Code Reviewer."""
 
+import asyncio
 import sys
 import subprocess
 from pathlib import Path
@@ -15,7 +16,8 @@ def run_tests():
         subprocess.run(
             [sys.executable, "-m", "pytest", "--version"],
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("❌ pytest not found. Installing...")
@@ -28,6 +30,7 @@ def run_tests():
                 "pytest",
                 "pytest-cov",
                 "pytest-mock",
+                "pytest-xdist",
             ],
             check=True,
         )
@@ -54,48 +57,63 @@ def run_tests():
         return False
 
 
+async def _run_tool(cmd):
+    """Run a tool as a subprocess and return its exit code."""
+    # Only the exit code is reported, so don't pipe the (possibly large) output
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+    )
+    return await process.wait()
+
+
+async def _run_tools(cmds):
+    """Run tools concurrently and return their exit codes in order."""
+    return await asyncio.gather(*(_run_tool(cmd) for cmd in cmds))
+
+
 def run_linting():
     """Run code quality checks."""
     print("🔍 Running code quality checks...")
 
-    # Black formatting check
-    print("  Checking code formatting (black)...")
-    try:
-        subprocess.run(
+    # (command, label, success message, failure message, blocking)
+    checks = [
+        (
             [sys.executable, "-m", "black", "--check", "ab_reviewer/", "tests/"],
-            check=True,
-            capture_output=True,
-        )
-        print("  ✅ Code formatting is correct")
-    except subprocess.CalledProcessError:
-        print("  ❌ Code formatting issues found. Run: black ab_reviewer/ tests/")
-        return False
-
-    # Pylint
-    print("  Running pylint...")
-    try:
-        subprocess.run(
+            "Checking code formatting (black)...",
+            "✅ Code formatting is correct",
+            "❌ Code formatting issues found. Run: black ab_reviewer/ tests/",
+            True,
+        ),
+        (
             [sys.executable, "-m", "pylint", "ab_reviewer/"],
-            check=True,
-            capture_output=True,
-        )
-        print("  ✅ Pylint passed")
-    except subprocess.CalledProcessError:
-        print("  ⚠️  Pylint found issues (non-blocking)")
-
-    # Bandit security check
-    print("  Running security check (bandit)...")
-    try:
-        subprocess.run(
+            "Running pylint...",
+            "✅ Pylint passed",
+            "⚠️  Pylint found issues (non-blocking)",
+            False,
+        ),
+        (
             [sys.executable, "-m", "bandit", "-r", "ab_reviewer/"],
-            check=True,
-            capture_output=True,
-        )
-        print("  ✅ Security check passed")
-    except subprocess.CalledProcessError:
-        print("  ⚠️  Security issues found (non-blocking)")
+            "Running security check (bandit)...",
+            "✅ Security check passed",
+            "⚠️  Security issues found (non-blocking)",
+            False,
+        ),
+    ]
+
+    # Tools are independent, so run them concurrently and report in fixed order
+    returncodes = asyncio.run(_run_tools([check[0] for check in checks]))
+
+    passed = True
+    for (_, label, ok_msg, fail_msg, blocking), returncode in zip(checks, returncodes):
+        print(f"  {label}")
+        if returncode == 0:
+            print(f"  {ok_msg}")
+        else:
+            print(f"  {fail_msg}")
+            if blocking:
+                passed = False
 
-    return True
+    return passed
 
 
 def main():
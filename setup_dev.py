@@ -43,17 +43,20 @@ def install_dependencies():
     """Install all dependencies."""
     print("📦 Installing dependencies...")
 
-    # Install core dependencies
+    # Install core and dev dependencies in a single pip run (pip cannot
+    # safely run concurrently, but one resolver pass avoids a second startup)
     if not run_command(
-        [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-        "Installing core dependencies",
-    ):
-        return False
-
-    # Install dev dependencies
-    if not run_command(
-        [sys.executable, "-m", "pip", "install", "-r", "requirements-dev.txt"],
-        "Installing dev dependencies",
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "-r",
+            "requirements.txt",
+            "-r",
+            "requirements-dev.txt",
+        ],
+        "Installing core and dev dependencies",
     ):
         return False
 
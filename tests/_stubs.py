@@ -0,0 +1,47 @@
+"""Lightweight stand-ins and helpers shared by the tests."""
+
+import collections
+import os
+from typing import Mapping, Union
+
+_RunResult = collections.namedtuple("_RunResult", "returncode stdout stderr")
+
+
+class FakeRunner:
+    """Canned ``run_command``/``check_tool_available`` results for tests."""
+
+    def __init__(self):
+        self.responses = {}
+        self.available = {}
+        self.calls = []
+
+    def run_command(self, cmd, *args, **kwargs):
+        """Return the response registered for the command's first two words."""
+        self.calls.append(cmd)
+        response = self.responses.get(" ".join(cmd[:2]), (True, ""))
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    def check_tool_available(self, tool_name):
+        """Report tools as available unless registered otherwise."""
+        return self.available.get(tool_name, True)
+
+
+def write_files(
+    root: Union[str, "os.PathLike[str]"], mapping: Mapping[str, str]
+) -> None:
+    """
+    Write several small files under a directory in one pass.
+
+    Args:
+        root: Directory to write into
+        mapping: File names (relative to root) mapped to their contents
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    for name, content in mapping.items():
+        fd = os.open(os.path.join(root, name), flags, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
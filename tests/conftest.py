@@ -0,0 +1,135 @@
+"""Shared pytest fixtures for AB Code Reviewer tests."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ab_reviewer.ai import gemini_client as gemini_module
+from ab_reviewer.ai.gemini_client import GeminiClient
+from ab_reviewer.core.detector import ProjectDetector
+from ab_reviewer.core.enhanced_runner import EnhancedToolRunner
+from ab_reviewer.utils.git import GitManager
+
+from ._stubs import FakeRunner
+
+
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow (e.g. ones that spawn real processes)",
+    )
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="write .pytest_cache (always on when CI is set; needed for --lf/--ff)",
+    )
+
+
+def pytest_configure(config):
+    """Make pytest cache writes opt-in for local runs."""
+    cache = getattr(config, "cache", None)
+    if cache is None or config.getoption("--cached") or os.environ.get("CI"):
+        return
+    cache.set = lambda key, value: None
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def _empty_template(tmp_path_factory):
+    """Empty project directory built once per session."""
+    return tmp_path_factory.mktemp("empty-template")
+
+
+@pytest.fixture(scope="session")
+def _git_template(tmp_path_factory):
+    """Project directory with a ``.git`` directory, built once per session."""
+    template = tmp_path_factory.mktemp("git-template")
+    (template / ".git").mkdir()
+    return template
+
+
+@pytest.fixture(scope="session")
+def existing_file(tmp_path_factory):
+    """A regular file that exists for the whole session; do not modify it."""
+    path = tmp_path_factory.mktemp("f") / "x"
+    path.touch()
+    return path
+
+
+@pytest.fixture
+def empty_dir(tmp_path, _empty_template):
+    """Per-test copy of the empty project template."""
+    return Path(shutil.copytree(_empty_template, tmp_path / "project"))
+
+
+@pytest.fixture
+def git_dir(tmp_path, _git_template):
+    """Per-test copy of the project template containing ``.git``."""
+    return Path(shutil.copytree(_git_template, tmp_path / "project"))
+
+
+@pytest.fixture(scope="module")
+def module_dir(tmp_path_factory, request):
+    """Empty directory shared by all tests in a module."""
+    return tmp_path_factory.mktemp(request.module.__name__.rpartition(".")[2])
+
+
+@pytest.fixture(scope="module")
+def gemini_client(module_dir):
+    """GeminiClient on an empty project, for tests that do not mutate it."""
+    return GeminiClient(str(module_dir))
+
+
+@pytest.fixture(scope="module")
+def enhanced_runner(module_dir):
+    """EnhancedToolRunner on an empty project, for read-only tests."""
+    return EnhancedToolRunner(str(module_dir))
+
+
+@pytest.fixture(scope="module")
+def detector(module_dir):
+    """ProjectDetector on an empty project, for read-only tests."""
+    return ProjectDetector(str(module_dir))
+
+
+@pytest.fixture
+def fake_runner(monkeypatch):
+    """
+    Route the Gemini client's subprocess helpers to a FakeRunner.
+
+    Tests register canned results, e.g.
+    ``fake_runner.responses["gemini --version"] = (True, "1.0.0")``.
+    """
+    fake = FakeRunner()
+    monkeypatch.setattr(gemini_module, "run_command", fake.run_command)
+    monkeypatch.setattr(
+        gemini_module, "check_tool_available", fake.check_tool_available
+    )
+    return fake
+
+
+@pytest.fixture(scope="module")
+def git_manager_empty(_empty_template):
+    """GitManager on the shared empty template, for read-only tests."""
+    return GitManager(_empty_template)
+
+
+@pytest.fixture(scope="module")
+def git_manager_with_git(_git_template):
+    """GitManager on the shared ``.git`` template, for read-only tests."""
+    return GitManager(_git_template)
@@ -1,10 +1,14 @@
 """Tests for CLI interface."""
 
-import tempfile
+import os
 from pathlib import Path
+
+import pytest
 from click.testing import CliRunner
 
+from ab_reviewer import cli
 from ab_reviewer.cli import main, load_configuration, merge_configs
+from ab_reviewer.utils.report_generator import ReportGenerator
 
 
 class TestCLI:
@@ -17,6 +21,36 @@ class TestCLI:
         assert result.exit_code == 0
         assert "AB Code Reviewer" in result.output
 
+    def test_generate_report_builds_report_once(self, monkeypatch, tmp_path):
+        """Test --generate-report prints the summary of the saved report."""
+        calls = []
+        generate = ReportGenerator.generate_comprehensive_report
+
+        def counting_generate(self):
+            calls.append(self)
+            return generate(self)
+
+        monkeypatch.setattr(
+            ReportGenerator, "generate_comprehensive_report", counting_generate
+        )
+        result = CliRunner().invoke(
+            main, ["--generate-report", "--project-dir", str(tmp_path)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert len(calls) == 1
+        assert "Total Reviews: 0" in result.output
+
+    def test_generate_report_reports_reused_files(self, tmp_path):
+        """Test --generate-report says when unchanged reports are reused."""
+        args = ["--generate-report", "--project-dir", str(tmp_path)]
+        first = CliRunner().invoke(main, args)
+        second = CliRunner().invoke(main, args)
+
+        assert "Markdown report saved to:" in first.output
+        assert "Markdown report unchanged, reusing:" in second.output
+        assert "JSON report unchanged, reusing:" in second.output
+
     def test_merge_configs(self):
         """Test configuration merging."""
         default = {
@@ -30,31 +64,126 @@ class TestCLI:
         assert merged["tools"]["linter"]["enabled"] is True
         assert merged["tools"]["linter"]["args"] == ["--max-line-length=100"]
 
-    def test_load_configuration_with_defaults(self):
+    def test_load_configuration_with_defaults(self, tmp_path):
         """Test loading default configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = load_configuration(None, Path(tmpdir))
+        config = load_configuration(None, tmp_path)
 
-            assert "project" in config
-            assert "tools" in config
-            assert "ai" in config
-            assert config["project"]["type"] == "python"
+        assert "project" in config
+        assert "tools" in config
+        assert "ai" in config
+        assert config["project"]["type"] == "python"
 
-    def test_load_configuration_with_custom_file(self):
+    def test_load_configuration_with_custom_file(self, tmp_path):
         """Test loading custom configuration file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create custom config
-            config_file = Path(tmpdir) / "custom.yaml"
-            config_file.write_text(
-                """
+        # Create custom config
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text(
+            """
 project:
   type: python
 tools:
   linter:
     enabled: false
 """
-            )
+        )
+
+        config = load_configuration(config_file, tmp_path)
+
+        assert config["tools"]["linter"]["enabled"] is False
+
+    def test_load_configuration_parses_defaults_once(self, monkeypatch, tmp_path):
+        """Test the default config is parsed once and callers get copies."""
+        first = load_configuration(None, tmp_path)
+        first["tools"]["linter"]["enabled"] = "mutated"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("default config parsed again")
+
+        monkeypatch.setattr("ab_reviewer.cli.yaml.load", fail)
+        second = load_configuration(None, tmp_path)
+
+        assert second["tools"]["linter"]["enabled"] != "mutated"
+
+    def test_load_configuration_json_cache(self, monkeypatch, tmp_path):
+        """Test parsed YAML is cached as JSON when AB_REVIEWER_CACHE=1."""
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text("tools:\n  linter:\n    enabled: false\n")
+        mtime_ns = config_file.stat().st_mtime_ns
+        cache_file = tmp_path / f"custom.yaml.{mtime_ns}.abr-cache.json"
+        default_dir = Path(cli.__file__).parent / "config"
+        monkeypatch.setenv("AB_REVIEWER_CACHE", "1")
+
+        load_configuration(config_file, tmp_path)
+        assert cache_file.exists()
+        assert list(default_dir.glob("*.json")) == []
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed despite fresh JSON cache")
+
+        cli._parse_yaml_cached.cache_clear()
+        monkeypatch.setattr("ab_reviewer.cli.yaml.load", fail)
+        config = cli._load_yaml(config_file, json_cache=True)
+        assert config["tools"]["linter"]["enabled"] is False
+
+    @pytest.mark.parametrize(
+        "content", ["since: 2024-01-01\n", "ports:\n  8080: web\n"]
+    )
+    def test_json_cache_skips_lossy_yaml(self, monkeypatch, tmp_path, content):
+        """Test YAML that does not survive a JSON round trip is not cached."""
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text(content)
+        monkeypatch.setenv("AB_REVIEWER_CACHE", "1")
+
+        first = cli._load_yaml(config_file, json_cache=True)
+        cli._parse_yaml_cached.cache_clear()
+
+        assert list(tmp_path.glob("*.json")) == []
+        assert cli._load_yaml(config_file, json_cache=True) == first
+
+    def test_json_cache_removes_stale_siblings(self, monkeypatch, tmp_path):
+        """Test writing a new cache removes caches for older mtimes."""
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text("ai:\n  enabled: true\n")
+        monkeypatch.setenv("AB_REVIEWER_CACHE", "1")
+        cli._load_yaml(config_file, json_cache=True)
+        old_cache = cli._json_cache_path(config_file, config_file.stat().st_mtime_ns)
+        unrelated = tmp_path / "custom.notes.json"
+        unrelated.write_text("{}")
+        other_yaml_cache = cli._json_cache_path(tmp_path / "custom.yml", 1)
+        other_yaml_cache.write_text("{}")
+
+        config_file.write_text("ai:\n  enabled: false\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        config = cli._load_yaml(config_file, json_cache=True)
+
+        new_cache = cli._json_cache_path(config_file, config_file.stat().st_mtime_ns)
+        assert config["ai"]["enabled"] is False
+        assert new_cache.exists()
+        assert not old_cache.exists()
+        assert unrelated.exists()
+        assert other_yaml_cache.exists()
+
+    def test_json_cache_keeps_user_json_files(self, monkeypatch, tmp_path):
+        """Test JSON files the tool did not write are never removed."""
+        config_file = tmp_path / "settings.yaml"
+        config_file.write_text("ai:\n  enabled: true\n")
+        user_file = tmp_path / "settings.2024.json"
+        user_file.write_text('{"keep": true}')
+        monkeypatch.setenv("AB_REVIEWER_CACHE", "1")
+
+        cli._load_yaml(config_file, json_cache=True)
+
+        assert user_file.read_text() == '{"keep": true}'
+        assert list(tmp_path.glob("*.abr-cache.json")) == [
+            cli._json_cache_path(config_file, config_file.stat().st_mtime_ns)
+        ]
 
-            config = load_configuration(config_file, Path(tmpdir))
+    def test_load_configuration_no_json_cache_by_default(self, monkeypatch, tmp_path):
+        """Test no JSON cache file is written unless opted in."""
+        monkeypatch.delenv("AB_REVIEWER_CACHE", raising=False)
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text("ai:\n  enabled: false\n")
 
-            assert config["tools"]["linter"]["enabled"] is False
+        load_configuration(config_file, tmp_path)
+        assert list(tmp_path.glob("*.json")) == []
@@ -1,84 +1,84 @@
 """Tests for project detector."""
 
-import tempfile
-from pathlib import Path
+import os
+
+import pytest
 
 from ab_reviewer.core.detector import ProjectDetector
+from ab_reviewer.utils.exceptions import ProjectDetectionError
+
+from ._stubs import write_files
 
 
 class TestProjectDetector:
     """Test cases for ProjectDetector."""
 
-    def test_detect_python_project_with_pyproject_toml(self):
-        """Test detection of Python project with pyproject.toml."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create pyproject.toml
-            (Path(tmpdir) / "pyproject.toml").write_text("[build-system]")
-
-            detector = ProjectDetector(tmpdir)
-            assert detector.detect_project_type() == "python"
-
-    def test_detect_python_project_with_setup_py(self):
-        """Test detection of Python project with setup.py."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create setup.py
-            (Path(tmpdir) / "setup.py").write_text("from setuptools import setup")
-
-            detector = ProjectDetector(tmpdir)
-            assert detector.detect_project_type() == "python"
-
-    def test_detect_python_project_with_requirements_txt(self):
-        """Test detection of Python project with requirements.txt."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create requirements.txt
-            (Path(tmpdir) / "requirements.txt").write_text("click>=8.0.0")
-
-            detector = ProjectDetector(tmpdir)
-            assert detector.detect_project_type() == "python"
-
-    def test_detect_python_project_with_py_files(self):
-        """Test detection of Python project with .py files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create Python file
-            (Path(tmpdir) / "main.py").write_text("print('hello')")
-
-            detector = ProjectDetector(tmpdir)
-            assert detector.detect_project_type() == "python"
-
-    def test_detect_unknown_project(self):
+    @pytest.mark.parametrize(
+        "fname,content",
+        [
+            ("pyproject.toml", "[build-system]"),
+            ("setup.py", "from setuptools import setup"),
+            ("requirements.txt", "click>=8.0.0"),
+            ("main.py", "print('hello')"),
+        ],
+    )
+    def test_detect_python_project(self, tmp_path, fname, content):
+        """Test detection of Python project from a single marker file."""
+        write_files(tmp_path, {fname: content})
+
+        detector = ProjectDetector(tmp_path)
+        assert detector.detect_project_type() == "python"
+
+    @pytest.mark.parametrize(
+        "fname,expected",
+        [("pom.xml", "java"), ("build.gradle", "java"), ("go.mod", "go")],
+    )
+    def test_detect_other_project_types(self, tmp_path, fname, expected):
+        """Test detection of Java and Go projects from root marker files."""
+        write_files(tmp_path, {fname: ""})
+
+        detector = ProjectDetector(tmp_path)
+        assert detector.detect_project_type() == expected
+
+    def test_detect_unknown_project(self, tmp_path):
         """Test detection of unknown project type."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create non-Python file
-            (Path(tmpdir) / "README.md").write_text("# Project")
+        # Create non-Python file
+        write_files(tmp_path, {"README.md": "# Project"})
 
-            detector = ProjectDetector(tmpdir)
-            assert detector.detect_project_type() == "unknown"
+        detector = ProjectDetector(tmp_path)
+        assert detector.detect_project_type() == "unknown"
 
-    def test_is_git_repository(self):
+    def test_is_git_repository(self, tmp_path):
         """Test git repository detection."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create .git directory
-            (Path(tmpdir) / ".git").mkdir()
+        # Create .git directory
+        os.mkdir(os.path.join(tmp_path, ".git"))
 
-            detector = ProjectDetector(tmpdir)
-            assert detector._is_git_repository() is True
+        detector = ProjectDetector(tmp_path)
+        assert detector._is_git_repository() is True
 
-    def test_is_not_git_repository(self):
+    def test_is_not_git_repository(self, detector):
         """Test non-git repository detection."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            detector = ProjectDetector(tmpdir)
-            assert detector._is_git_repository() is False
+        assert detector._is_git_repository() is False
 
-    def test_get_project_info(self):
+    def test_get_project_info(self, tmp_path):
         """Test getting comprehensive project information."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create Python project files
-            (Path(tmpdir) / "pyproject.toml").write_text("[build-system]")
-            (Path(tmpdir) / ".git").mkdir()
-
-            detector = ProjectDetector(tmpdir)
-            info = detector.get_project_info()
-
-            assert info["type"] == "python"
-            assert info["path"] == str(Path(tmpdir).resolve())
-            assert info["is_git_repo"] is True
+        # Create Python project files
+        write_files(tmp_path, {"pyproject.toml": "[build-system]"})
+        os.mkdir(os.path.join(tmp_path, ".git"))
+
+        detector = ProjectDetector(tmp_path)
+        info = detector.get_project_info()
+
+        assert info["type"] == "python"
+        assert info["path"] == str(tmp_path.resolve())
+        assert info["is_git_repo"] is True
+
+    def test_missing_project_path(self, tmp_path):
+        """Test a non-existent project path is rejected."""
+        with pytest.raises(ProjectDetectionError, match="does not exist"):
+            ProjectDetector(tmp_path / "missing")
+
+    def test_project_path_is_file(self, existing_file):
+        """Test a project path that is a regular file is rejected."""
+        with pytest.raises(ProjectDetectionError, match="not a directory"):
+            ProjectDetector(existing_file)
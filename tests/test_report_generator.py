@@ -0,0 +1,209 @@
+"""Tests for report generator."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+
+from ab_reviewer.utils.exceptions import ValidationError
+from ab_reviewer.utils import report_generator
+from ab_reviewer.utils.report_generator import ReportGenerator
+
+
+def _write_review(project_dir: Path, timestamp: str, gates: dict) -> None:
+    """Create a review run directory with quality gate results."""
+    review_dir = project_dir / "reviews" / timestamp
+    review_dir.mkdir(parents=True)
+    (review_dir / "quality_gates.json").write_text(json.dumps(gates))
+    (review_dir / "ai_review.md").write_text("Looks good")
+    (review_dir / "review.log").write_text("log")
+
+
+class TestReportGenerator:
+    """Test cases for ReportGenerator."""
+
+    def test_empty_project_dir(self, tmp_path):
+        """Test report generation with no review data."""
+        generator = ReportGenerator(tmp_path)
+        report = generator.generate_comprehensive_report()
+
+        assert report["project_analysis"] is None
+        assert report["review_history"] == []
+        assert report["summary"]["total_reviews"] == 0
+        assert report["summary"]["overall_health"] == "unknown"
+
+    def test_review_history_and_summary(self, tmp_path):
+        """Test review history loading and summary statistics."""
+        _write_review(
+            tmp_path,
+            "2024-01-01_10-00-00",
+            {"formatter": {"success": True}, "linter": {"success": True}},
+        )
+        _write_review(
+            tmp_path,
+            "2024-01-02_10-00-00",
+            {"formatter": {"success": False}, "linter": {"success": True}},
+        )
+
+        generator = ReportGenerator(tmp_path)
+        report = generator.generate_comprehensive_report()
+
+        reviews = report["review_history"]
+        assert [r["timestamp"] for r in reviews] == [
+            "2024-01-01_10-00-00",
+            "2024-01-02_10-00-00",
+        ]
+        assert reviews[0]["ai_review"] == "Looks good"
+        assert reviews[0]["log_file"].endswith("review.log")
+
+        summary = report["summary"]
+        assert summary["total_reviews"] == 2
+        assert summary["quality_trends"]["formatter"] == {"passed": 1, "failed": 1}
+        assert summary["overall_health"] == "fair"
+
+        titles = [r["title"] for r in report["recommendations"]]
+        assert "Fix code formatting" in titles
+
+    def test_data_loaded_once(self, tmp_path):
+        """Test that project data is read from disk only once per instance."""
+        generator = ReportGenerator(tmp_path)
+
+        with patch.object(
+            ReportGenerator, "_load_review_history", return_value=[]
+        ) as mock_load:
+            generator.generate_comprehensive_report()
+            generator.generate_comprehensive_report()
+
+        assert mock_load.call_count == 1
+
+    def test_project_analysis_cache_invalidated_on_change(self, tmp_path):
+        """Test project analysis is re-read when the file changes."""
+        analysis_file = tmp_path / "structure" / "project_analysis.json"
+        analysis_file.parent.mkdir()
+        analysis_file.write_text(json.dumps({"version": 1}))
+        assert ReportGenerator(tmp_path).project_analysis == {"version": 1}
+
+        analysis_file.write_text(json.dumps({"version": 2}))
+        stat = analysis_file.stat()
+        os.utime(analysis_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert ReportGenerator(tmp_path).project_analysis == {"version": 2}
+
+    def test_long_history_hits_json_caches(self, tmp_path):
+        """Test JSON caches keep hitting with more reviews than the old LRU size."""
+        analysis_file = tmp_path / "structure" / "project_analysis.json"
+        analysis_file.parent.mkdir()
+        analysis_file.write_text(json.dumps({"version": 1}))
+        for day in range(1, 21):
+            _write_review(
+                tmp_path, f"2024-01-{day:02d}_10-00-00", {"tests": {"success": True}}
+            )
+        report_generator._load_analysis_cached.cache_clear()
+        report_generator._load_review_json_cached.cache_clear()
+
+        for _ in range(3):
+            ReportGenerator(tmp_path).generate_comprehensive_report()
+
+        reviews = report_generator._load_review_json_cached.cache_info()
+        analysis = report_generator._load_analysis_cached.cache_info()
+        assert (reviews.hits, reviews.misses) == (40, 20)
+        assert (analysis.hits, analysis.misses) == (2, 1)
+
+    def test_report_data_not_shared_between_generators(self, tmp_path):
+        """Test mutating one report does not leak into cached JSON data."""
+        analysis_file = tmp_path / "structure" / "project_analysis.json"
+        analysis_file.parent.mkdir()
+        analysis_file.write_text(json.dumps({"version": 1}))
+        _write_review(tmp_path, "2024-01-01_10-00-00", {"tests": {"success": True}})
+
+        report = ReportGenerator(tmp_path).generate_comprehensive_report()
+        report["project_analysis"]["version"] = 2
+        report["review_history"][0]["quality_gates"]["tests"]["success"] = False
+
+        fresh = ReportGenerator(tmp_path).generate_comprehensive_report()
+        assert fresh["project_analysis"] == {"version": 1}
+        assert fresh["review_history"][0]["quality_gates"] == {
+            "tests": {"success": True}
+        }
+
+    def test_save_markdown_report(self, tmp_path):
+        """Test saving Markdown report."""
+        _write_review(tmp_path, "2024-01-01_10-00-00", {"tests": {"success": True}})
+
+        output_path = ReportGenerator(tmp_path).save_markdown_report()
+
+        content = output_path.read_text()
+        assert output_path.parent == tmp_path.resolve() / "reports"
+        assert content.startswith(f"# AB Code Reviewer Report: {tmp_path.name}")
+        assert "- **Total Reviews:** 1" in content
+        assert "- **Tests:** ✅" in content
+        assert content.endswith("✅\n")
+
+    def test_markdown_report_ends_with_single_newline(self, tmp_path):
+        """Test a report with only the header section ends with one newline."""
+        report = {"project_name": "demo", "generated_at": "now", "summary": {}}
+
+        content = ReportGenerator(tmp_path)._format_markdown_report(report)
+
+        assert content.endswith("- **Overall Health:** Unknown\n")
+
+    def test_save_json_report(self, tmp_path):
+        """Test saving JSON report."""
+        output_path = ReportGenerator(tmp_path).save_json_report()
+
+        data = json.loads(output_path.read_text())
+        assert data["project_name"] == tmp_path.resolve().name
+        assert data["summary"]["total_reviews"] == 0
+
+    def test_save_reports(self, tmp_path):
+        """Test saving several report formats with a shared timestamp."""
+        generator = ReportGenerator(tmp_path)
+
+        with patch.object(
+            generator,
+            "generate_comprehensive_report",
+            wraps=generator.generate_comprehensive_report,
+        ) as mock_generate:
+            saved = generator.save_reports(formats=("md", "json"))
+
+        assert mock_generate.call_count == 1
+        assert saved["md"].suffix == ".md"
+        assert saved["json"].suffix == ".json"
+        assert saved["md"].stem == saved["json"].stem
+        assert saved["md"].exists() and saved["json"].exists()
+
+    def test_save_reports_skips_unchanged(self, tmp_path):
+        """Test unchanged reports reuse the previously saved files."""
+        first = ReportGenerator(tmp_path).save_reports()
+        first_md = first["md"].read_text()
+
+        generator = ReportGenerator(tmp_path)
+        with patch.object(ReportGenerator, "_write_md") as mock_write:
+            second = generator.save_reports()
+        assert second == first
+        assert generator.reused_formats == {"md", "json"}
+        mock_write.assert_not_called()
+        assert first["md"].read_text() == first_md
+
+        _write_review(tmp_path, "2024-01-01_10-00-00", {"tests": {"success": True}})
+        with patch.object(ReportGenerator, "_write_md") as mock_write:
+            ReportGenerator(tmp_path).save_reports()
+        mock_write.assert_called_once()
+
+    def test_save_reports_keeps_hashes_of_other_formats(self, tmp_path):
+        """Test saving one format keeps the last-hash entries of the others."""
+        first = ReportGenerator(tmp_path).save_reports()
+
+        generator = ReportGenerator(tmp_path)
+        generator.save_reports(formats=("md",), skip_unchanged=False)
+        assert generator.reused_formats == set()
+
+        generator = ReportGenerator(tmp_path)
+        again = generator.save_reports()
+        assert again["json"] == first["json"]
+        assert generator.reused_formats == {"md", "json"}
+
+    def test_save_reports_unsupported_format(self, tmp_path):
+        """Test saving reports in an unsupported format."""
+        with pytest.raises(ValidationError):
+            ReportGenerator(tmp_path).save_reports(formats=("html",))